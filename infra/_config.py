@@ -0,0 +1,36 @@
+"""Cached access to the parsed cdk.json configuration"""
+import functools
+import os
+from types import MappingProxyType
+
+from _serialization import loads, JSONDecodeError
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "cdk.json")
+
+
+def _freeze(value):
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@functools.lru_cache(maxsize=4)
+def _parse(path: str, mtime_ns: int, size: int) -> MappingProxyType:
+    """Parse a config file; mtime and size are part of the cache key only"""
+    try:
+        with open(path, 'rb') as f:
+            return _freeze(loads(f.read()))
+    except JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in cdk.json: {e}") from e
+
+
+def get_config() -> MappingProxyType:
+    """Return the parsed, read-only cdk.json, re-reading it only when the file changes"""
+    try:
+        st = os.stat(CONFIG_PATH)
+    except FileNotFoundError as e:
+        raise FileNotFoundError("cdk.json not found in the infra directory") from e
+    return _parse(CONFIG_PATH, st.st_mtime_ns, st.st_size)
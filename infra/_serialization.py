@@ -0,0 +1,17 @@
+"""JSON parsing helpers, preferring orjson when it is installed
+
+orjson is an optional dependency; without it the stdlib json module is used.
+"""
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+# this regardless of which backend is in use
+JSONDecodeError = _json.JSONDecodeError
+
+
+def loads(data: bytes):
+    """Parse JSON from raw bytes"""
+    return _json.loads(data)
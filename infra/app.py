@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 import os
-import json
 import logging
 from aws_cdk import App, Environment
 from s3 import S3Stack
 from vpc import VpcStack
+from _config import get_config
 
 # Set up logging
 logging.basicConfig(
@@ -14,51 +14,48 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def load_config():
-    """Load configuration from cdk.json"""
-    config_path = os.path.join(os.path.dirname(__file__), "cdk.json")
-    try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        raise FileNotFoundError("cdk.json not found in the infra directory")
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in cdk.json: {e}")
-
-
 def main():
     app = App()
     
     # Load configuration from cdk.json
-    config = load_config()
+    config = get_config()
     
     # Get environment from context or environment variable
     env_name = app.node.try_get_context("env") or os.environ.get("CDK_ENV", "development")
     aws_account_id = os.environ["CDK_DEFAULT_ACCOUNT"]
     
     # Get environment-specific configuration
-    env_config = config.get("context", {}).get(env_name, {})
-    if not env_config:
+    if env_name not in config.get("context", {}):
         raise ValueError(f"Environment '{env_name}' not found in cdk.json")
+    env_config = config["context"][env_name]
     
     # Read region from environment configuration
     region = env_config.get("region")
     if not region:
         raise ValueError(f"Region not found for environment '{env_name}' in cdk.json")
     
-    logger.info(f"Deploying to environment: {env_name}")
-    logger.info(f"Using region: {region}")
-    logger.info(f"Using account: {aws_account_id}")
+    # Resolve per-stack configuration once and hand it to the stacks
+    vpc_config = env_config.get("vpc", {})
+    if not vpc_config:
+        raise ValueError(f"VPC configuration not found for environment '{env_name}'")
+    s3_config = env_config.get("s3", [])
+    
+    logger.info("Deploying to environment: %s", env_name)
+    logger.info("Using region: %s", region)
+    logger.info("Using account: %s", aws_account_id)
 
     
     # AWS environment configuration
     aws_env = Environment(account=aws_account_id, region=region)
     
+    # Stacks are built serially: every construct call goes through the single
+    # jsii kernel process, which is not thread-safe, so threads would not help
     # Create the VPC stack first
     vpc_stack = VpcStack(
         app,
         f"VpcStack-{env_name}",
         env_name=env_name,
+        vpc_config=vpc_config,
         env=aws_env,
         description=f"VPC infrastructure for {env_name} environment"
     )
@@ -68,6 +65,7 @@ def main():
         app, 
         f"S3Stack-{env_name}",
         env_name=env_name,
+        s3_config=s3_config,
         env=aws_env,
         description=f"S3 buckets for {env_name} environment"
     )
@@ -1,6 +1,5 @@
-import json
-import os
 import logging
+from collections.abc import Mapping
 from aws_cdk import (
     Stack,
     aws_ec2 as ec2,
@@ -13,25 +12,15 @@ logger = logging.getLogger(__name__)
 
 
 class VpcStack(Stack):
-    def __init__(self, scope: Construct, construct_id: str, env_name: str, **kwargs) -> None:
+    def __init__(self, scope: Construct, construct_id: str, env_name: str, vpc_config: Mapping, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
         
-        logger.info(f"Initializing VPC stack for environment: {env_name}")
+        logger.info("Initializing VPC stack for environment: %s", env_name)
         
-        # Load configuration from cdk.json
-        config = self._load_config()
-        env_config = config.get("context", {}).get(env_name, {})
+        # Shared suffix for CloudFormation output descriptions
+        desc_suffix = f" for {env_name} environment"
         
-        if not env_config:
-            raise ValueError(f"Environment '{env_name}' not found in cdk.json")
-        
-        # Get VPC configuration
-        vpc_config = env_config.get("vpc", {})
-        
-        if not vpc_config:
-            raise ValueError(f"VPC configuration not found for environment '{env_name}'")
-        
-        logger.info(f"VPC configuration loaded - CIDR: {vpc_config.get('cidr')}, Max AZs: {vpc_config.get('max_azs')}")
+        logger.info("VPC configuration loaded - CIDR: %s, Max AZs: %s", vpc_config.get("cidr"), vpc_config.get("max_azs"))
         
         # Create VPC
         self.vpc = ec2.Vpc(
@@ -61,7 +50,7 @@ class VpcStack(Stack):
             ]
         )
         
-        logger.info(f"VPC created successfully for {env_name} environment")
+        logger.info("VPC created successfully for %s environment", env_name)
         
         # Create a security group for web services
         self.web_security_group = ec2.SecurityGroup(
@@ -85,7 +74,7 @@ class VpcStack(Stack):
             description="Allow HTTPS traffic"
         )
         
-        logger.info(f"Web security group created with HTTP/HTTPS access for {env_name}")
+        logger.info("Web security group created with HTTP/HTTPS access for %s", env_name)
         
         # Create a security group for database services
         self.db_security_group = ec2.SecurityGroup(
@@ -109,57 +98,61 @@ class VpcStack(Stack):
             description="Allow PostgreSQL access from web services"
         )
         
-        logger.info(f"Database security group created with MySQL/PostgreSQL access for {env_name}")
+        logger.info("Database security group created with MySQL/PostgreSQL access for %s", env_name)
         
         # Create VPC endpoints for common AWS services
         self._create_vpc_endpoints()
         
-        logger.info(f"Creating CloudFormation outputs for {env_name} VPC stack")
+        logger.info("Creating CloudFormation outputs for %s VPC stack", env_name)
+        
+        # Fetch subnet collections once; each property access crosses into jsii
+        public_subnets = self.vpc.public_subnets
+        private_subnets = self.vpc.private_subnets
         
         # CloudFormation outputs
         CfnOutput(
             self,
             f"VpcId-{env_name}",
             value=self.vpc.vpc_id,
-            description=f"VPC ID for {env_name} environment"
+            description="VPC ID" + desc_suffix
         )
         
         CfnOutput(
             self,
             f"VpcCidr-{env_name}",
             value=self.vpc.vpc_cidr_block,
-            description=f"VPC CIDR block for {env_name} environment"
+            description="VPC CIDR block" + desc_suffix
         )
         
         CfnOutput(
             self,
             f"PublicSubnetIds-{env_name}",
-            value=",".join([subnet.subnet_id for subnet in self.vpc.public_subnets]),
-            description=f"Public subnet IDs for {env_name} environment"
+            value=",".join(subnet.subnet_id for subnet in public_subnets),
+            description="Public subnet IDs" + desc_suffix
         )
         
         CfnOutput(
             self,
             f"PrivateSubnetIds-{env_name}",
-            value=",".join([subnet.subnet_id for subnet in self.vpc.private_subnets]),
-            description=f"Private subnet IDs for {env_name} environment"
+            value=",".join(subnet.subnet_id for subnet in private_subnets),
+            description="Private subnet IDs" + desc_suffix
         )
         
         CfnOutput(
             self,
             f"WebSecurityGroupId-{env_name}",
             value=self.web_security_group.security_group_id,
-            description=f"Web security group ID for {env_name} environment"
+            description="Web security group ID" + desc_suffix
         )
         
         CfnOutput(
             self,
             f"DatabaseSecurityGroupId-{env_name}",
             value=self.db_security_group.security_group_id,
-            description=f"Database security group ID for {env_name} environment"
+            description="Database security group ID" + desc_suffix
         )
         
-        logger.info(f"VPC stack initialization completed for {env_name}")
+        logger.info("VPC stack initialization completed for %s", env_name)
     
     def _create_vpc_endpoints(self):
         """Create VPC endpoints for AWS services"""
@@ -180,19 +173,3 @@ class VpcStack(Stack):
         )
         
         logger.info("VPC endpoints created successfully for S3 and DynamoDB")
-    
-    def _load_config(self):
-        """Load configuration from cdk.json"""
-        logger.debug("Loading configuration from cdk.json")
-        config_path = os.path.join(os.path.dirname(__file__), "cdk.json")
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                logger.debug("Configuration loaded successfully from cdk.json")
-                return config
-        except FileNotFoundError:
-            logger.error("cdk.json not found in the infra directory")
-            raise FileNotFoundError("cdk.json not found in the infra directory")
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in cdk.json: {e}")
-            raise ValueError(f"Invalid JSON in cdk.json: {e}") 
\ No newline at end of file